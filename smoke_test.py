@@ -0,0 +1,86 @@
+"""
+End-to-end smoke run for the sales pipeline.
+Builds tiny sample source files in a temporary folder, points Config at them,
+and runs the full pipeline twice: a cold run and a warm Parquet-cache run.
+Run it with:  python smoke_test.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+
+def main():
+    tmp = tempfile.mkdtemp(prefix="sales_pipeline_smoke_")
+    os.chdir(tmp)  # Keeps the Config-created output folders out of the repo..
+
+    import pandas as pd
+    from Data_Pipe_Updated import Config, SalesDataPipeline, PYARROW_AVAILABLE
+
+    # Small but representative sample sources (stray whitespace and missing
+    # values on purpose, so the cleaning steps actually do something)..
+    sales = pd.DataFrame({
+        'Date': ['2024-01-05', '2024-01-20', '2024-02-11', '2024-02-28', '2024-03-15'],
+        'Product': ['Laptop', 'Phone', 'Laptop', 'Tablet', 'Phone'],
+        'Region': ['North', 'South', 'North', 'East', 'South'],
+        'Units Sold': [2, 1, None, 3, 5],
+        'Revenue': [2000.0, 650.0, 1100.0, None, 3200.0],
+    })
+    sales_csv = os.path.join(tmp, "sales_data.csv")
+    sales.to_csv(sales_csv, index=False)
+
+    products = [
+        {"Product": " Laptop", "Category": "Computers"},
+        {"Product": "Phone ", "Category": "Mobiles"},
+        {"Product": "Tablet", "Category": None},
+    ]
+    product_json = os.path.join(tmp, "product_metadata.json")
+    with open(product_json, "w") as f:
+        json.dump(products, f)
+
+    regions = pd.DataFrame({
+        'Region': [' North', 'South ', 'East'],
+        'Manager': ['Asha ', ' Ravi', 'Kiran'],
+    })
+    region_xlsx = os.path.join(tmp, "region_info.xlsx")
+    regions.to_excel(region_xlsx, index=False)
+
+    # Point every configured path into the temp folder..
+    report_dir = os.path.join(tmp, "reports") + os.sep
+    viz_dir = os.path.join(tmp, "visualizations")
+    os.makedirs(report_dir, exist_ok=True)
+    os.makedirs(viz_dir, exist_ok=True)
+    Config.SALES_CSV_PATH = sales_csv
+    Config.PRODUCT_JSON_PATH = product_json
+    Config.REGION_EXCEL_PATH = region_xlsx
+    Config.MERGED_CACHE_PATH = os.path.join(tmp, "merged.parquet")
+    Config.REPORT_DIR = report_dir
+    Config.VISUALIZATION_DIR = viz_dir
+    Config.DB_FILE = os.path.join(tmp, "sales_database.duckdb")
+    Config.SQLITE_FALLBACK_FILE = os.path.join(tmp, "sales_database.db")
+
+    print("--- Cold run (parses the source files) ---")
+    SalesDataPipeline().run_pipeline()
+
+    for name in ["monthly_sales.csv", "product_performance.csv", "regional_performance.csv"]:
+        assert os.path.exists(report_dir + name), f"missing report: {name}"
+    assert os.path.exists(os.path.join(viz_dir, "sales_dashboard.png")), "missing dashboard"
+
+    # The merged Parquet snapshot only exists when pyarrow is installed, so the
+    # second run is a warm cache run with pyarrow and simply a second cold run without..
+    if PYARROW_AVAILABLE:
+        assert os.path.exists(Config.MERGED_CACHE_PATH), "missing merged cache"
+        print("\n--- Warm run (merged Parquet cache) ---")
+    else:
+        print("\n--- Second run (no pyarrow, so cold again) ---")
+    SalesDataPipeline().run_pipeline()
+
+    print(f"\nSmoke run OK (outputs under {tmp})")
+
+
+if __name__ == "__main__":
+    main()